@@ -226,12 +226,29 @@ class JSONFieldAnonymizer(FieldAnonymizer):
             return not value
         return value
 
+    def anonymize_json_value_inplace(self, value: Union[list, dict, bool, None, str, int, float],
+                                     encryption_key: str,
+                                     anonymize: bool = True) -> Union[list, dict, bool, None, str, int, float]:
+        """
+        Same as ``anonymize_json_value`` but dicts and lists are updated in place instead of being copied.
+        Use it only for values owned by the caller (e.g. freshly parsed json).
+        """
+        if type(value) is dict:
+            for key, item in value.items():  # type: ignore
+                value[key] = self.anonymize_json_value_inplace(item, encryption_key, anonymize)  # type: ignore
+        elif type(value) is list:
+            for i, item in enumerate(value):  # type: ignore
+                value[i] = self.anonymize_json_value_inplace(item, encryption_key, anonymize)  # type: ignore
+        else:
+            return self.anonymize_json_value(value, encryption_key, anonymize)
+        return value
+
     def get_encrypted_value(self, value, encryption_key: str):
         if type(value) not in [dict, list, str]:
             raise ValidationError("JSONFieldAnonymizer encountered unknown type of json. "
                                   "Only python dict and list are supported.")
         if type(value) == str:
-            return json.dumps(self.anonymize_json_value(json.loads(value), encryption_key))
+            return json.dumps(self.anonymize_json_value_inplace(json.loads(value), encryption_key))
         return self.anonymize_json_value(value, encryption_key)
 
     def get_decrypted_value(self, value, encryption_key: str):
@@ -239,7 +256,7 @@ class JSONFieldAnonymizer(FieldAnonymizer):
             raise ValidationError("JSONFieldAnonymizer encountered unknown type of json. "
                                   "Only python dict and list are supported.")
         if type(value) == str:
-            return json.dumps(self.anonymize_json_value(json.loads(value), encryption_key, anonymize=False))
+            return json.dumps(self.anonymize_json_value_inplace(json.loads(value), encryption_key, anonymize=False))
         return self.anonymize_json_value(value, encryption_key, anonymize=False)
 
 
@@ -9,11 +9,12 @@ from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
 from django.core import serializers
 from django.db import transaction
-from django.db.models import Model, QuerySet
+from django.db.models import Model, QuerySet, prefetch_related_objects
 from django.db.models.fields import Field
 
 from gdpr.anonymizers.base import BaseAnonymizer, FieldAnonymizer, RelationAnonymizer
 from gdpr.fields import Fields
+from gdpr.loading import anonymizer_register
 from gdpr.models import AnonymizedData, LegalReason
 from gdpr.utils import (
     get_field_or_none, get_reversion_version_model, get_all_parent_objects, get_all_obj_and_parent_versions,
@@ -34,8 +35,6 @@ class ModelAnonymizerMeta(type):
     """
 
     def __new__(cls, name, bases, attrs):
-        from gdpr.loading import anonymizer_register
-
         new_obj = super().__new__(cls, name, bases, attrs)
 
         # Also ensure initialization is only performed for subclasses of ModelAnonymizer
@@ -328,7 +327,12 @@ class ModelAnonymizerBase(BaseAnonymizer, metaclass=ModelAnonymizerMeta):
         """
         related_attribute = getattr(obj, field_name, None)
         if related_metafield.one_to_many or related_metafield.many_to_many:
-            for related_obj in related_attribute.all():
+            related_objs = list(related_attribute.all())
+            prefetch_lookups = related_fields.anonymizer.get_related_prefetch_lookups(related_fields)
+            if prefetch_lookups:
+                # Relations of the nested levels are loaded with one query per relation instead of one per object
+                prefetch_related_objects(related_objs, *prefetch_lookups)
+            for related_obj in related_objs:
                 related_fields.anonymizer.update_obj(
                     related_obj, legal_reason, purpose, related_fields,
                     base_encryption_key=self._get_encryption_key(obj, field_name),
@@ -345,6 +349,25 @@ class ModelAnonymizerBase(BaseAnonymizer, metaclass=ModelAnonymizerMeta):
             warnings.warn(f'Model anonymization discovered unreachable field {field_name} on model'
                           f'{obj.__class__.__name__} on obj {obj} with pk {obj.pk}')
 
+    def get_related_prefetch_lookups(self, parsed_fields: Fields, prefix: str = '') -> List[str]:
+        """
+        Get prefetch lookups of all model relations in parsed_fields (relation anonymizers and properties are skipped).
+        Args:
+            parsed_fields: fields which will be anonymized
+            prefix: prefix of the lookups used for nested relations
+        """
+        lookups = []
+        for name, related_fields in parsed_fields.related_fields.items():
+            if isinstance(self.anonymizers.get(name), RelationAnonymizer):
+                continue
+            related_metafield = get_field_or_none(self.model, name)
+            if related_metafield is None or not related_metafield.is_relation:
+                continue
+            lookup = f'{prefix}{name}'
+            lookups.append(lookup)
+            lookups += related_fields.anonymizer.get_related_prefetch_lookups(related_fields, f'{lookup}__')
+        return lookups
+
     def update_related_fields(self, parsed_fields: Fields, obj: Model, legal_reason: Optional[LegalReason] = None,
                               purpose: Optional["AbstractPurpose"] = None, anonymization: bool = True):
         for name, related_fields in parsed_fields.related_fields.items():
@@ -13,6 +13,8 @@ if TYPE_CHECKING:
 
 
 class Fields:
+    __slots__ = ('local_fields', 'related_fields', 'anonymizer', 'model')
+
     local_fields: FieldList
     related_fields: RelatedFieldDict
     anonymizer: "ModelAnonymizer"
@@ -21,27 +23,46 @@ class Fields:
     def __init__(self, fields: FieldMatrix, model: Type[Model], anonymizer_instance: "ModelAnonymizer" = None):
         self.model = model
         self.anonymizer = anonymizer_register[self.model]() if anonymizer_instance is None else anonymizer_instance
-        self.local_fields = self.parse_local_fields(fields)
-        self.related_fields = self.parse_related_fields(fields)
+        self.local_fields, self.related_fields = self.parse_fields(fields)
+
+    def parse_fields(self, fields: FieldMatrix) -> Tuple[FieldList, RelatedFieldDict]:
+        """Split fields matrix to local fields and dictionary of related fields in a single pass."""
+        local_fields: List[str] = []
+        related_fields: RelatedFieldDict = {}
+        if fields != '__ALL__':
+            for field in fields:
+                if isinstance(field, str):
+                    local_fields.append(field)
+                elif isinstance(field, (list, tuple)):
+                    name, nested_fields = field
+                    related_fields[name] = Fields(
+                        nested_fields,
+                        self.anonymizer.get_related_model(name),
+                        anonymizer_instance=self.anonymizer.get_related_model_anonymizer_none(name)
+                    )
+
+        if fields == '__ALL__' or '__ALL__' in local_fields:
+            return list(self.anonymizer.keys()), related_fields
+
+        return local_fields, related_fields
 
     def parse_local_fields(self, fields: FieldMatrix) -> FieldList:
         """Get Iterable of local fields from fields matrix."""
-        if fields == '__ALL__' or ('__ALL__' in fields and type(fields) != str):
+        if fields == '__ALL__' or (not isinstance(fields, str) and '__ALL__' in fields):
             return list(self.anonymizer.keys())
 
-        return [field for field in fields if type(field) == str]
+        return [field for field in fields if isinstance(field, str)]
 
     def parse_related_fields(self, fields: FieldMatrix) -> RelatedFieldDict:
         """Get Dictionary of related fields from fields matrix."""
-        out_dict = {}
-        for name, related_fields in [field_tuple for field_tuple in fields if isinstance(field_tuple, (list, tuple))]:
-            out_dict[name] = Fields(
+        return {
+            name: Fields(
                 related_fields,
                 self.anonymizer.get_related_model(name),
                 anonymizer_instance=self.anonymizer.get_related_model_anonymizer_none(name)
             )
-
-        return out_dict
+            for name, related_fields in [field for field in fields if isinstance(field, (list, tuple))]
+        }
 
     def get_tuple(self) -> FieldMatrix:
         return (*self.local_fields, *[(name, fields.get_tuple()) for name, fields in self.related_fields.items()])
@@ -50,7 +71,12 @@ class Fields:
         return len(self.local_fields) + len(self.related_fields)
 
     def __isub__(self, other: "Fields") -> "Fields":
-        self.local_fields = [field for field in self.local_fields if field not in other.local_fields]
+        if len(self) == 0 or len(other) == 0:
+            # Nothing to subtract
+            return self
+
+        other_local_fields = frozenset(other.local_fields)
+        self.local_fields = [field for field in self.local_fields if field not in other_local_fields]
 
         for name, related_fields in self.related_fields.items():
             if name in other.related_fields:
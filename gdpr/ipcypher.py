@@ -8,6 +8,7 @@ IPv4 took from https://github.com/veorq/ipcrypt/blob/939549e3f542c7ae9eb1aec9616
 
 # type: ignore
 # flake8: noqa
+from functools import lru_cache
 from hashlib import pbkdf2_hmac
 from ipaddress import IPv4Address, IPv6Address, ip_address
 from typing import Union
@@ -22,9 +23,12 @@ IPv6Type = Union[str, IPv6Address]
 IPType = Union[IPv4Type, IPv6Type]
 
 
+@lru_cache(maxsize=128)
 def derive_key(key: str):
     """
     PBKDF2(SHA1, Password, 'ipcipheripcipher', 50000, 16)
+
+    The derivation is expensive by design, so the derived keys are cached.
     """
 
     return pbkdf2_hmac('sha1', bytes(key, encoding="utf-8"), bytes('ipcipheripcipher', encoding='utf-8'), 50000, 16)
@@ -140,8 +144,14 @@ def decrypt_ipv4(key: str, ip: IPv4Type) -> str:
     return decrypt_ipv4_bytes_key(derive_key(key), ip)
 
 
+@lru_cache(maxsize=128)
+def get_aes_cipher(key: bytes) -> AESModeOfOperationECB:
+    """ECB mode keeps no state between blocks, so the cipher with the expanded round keys can be reused."""
+    return AESModeOfOperationECB(key)
+
+
 def encrypt_ipv6_bytes_key(key: bytes, ip: IPv6Address) -> IPv6Address:
-    return IPv6Address(AESModeOfOperationECB(key).encrypt(ip.packed))
+    return IPv6Address(get_aes_cipher(key).encrypt(ip.packed))
 
 
 def encrypt_ipv6(key: str, ip: IPv6Type) -> str:
@@ -151,7 +161,7 @@ def encrypt_ipv6(key: str, ip: IPv6Type) -> str:
 
 
 def decrypt_ipv6_bytes_key(key: bytes, ip: IPv6Address) -> IPv6Address:
-    return IPv6Address(AESModeOfOperationECB(key).decrypt(ip.packed))
+    return IPv6Address(get_aes_cipher(key).decrypt(ip.packed))
 
 
 def decrypt_ipv6(key: str, ip: IPv6Type) -> str:
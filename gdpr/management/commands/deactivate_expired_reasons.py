@@ -15,8 +15,11 @@ logger = logging.getLogger(getattr(settings, 'GDPR_DEACTIVATE_EXPIRED_REASONS_LO
 
 class Command(BaseCommand):
 
+    def _get_chunk_size(self):
+        return getattr(settings, 'GDPR_DEACTIVATE_EXPIRED_REASONS_CHUNK_SIZE', None)
+
     def _slice_queryset(self, queryset):
-        chunk_size = getattr(settings, 'GDPR_DEACTIVATE_EXPIRED_REASONS_CHUNK_SIZE', None)
+        chunk_size = self._get_chunk_size()
         return queryset[:chunk_size] if chunk_size else queryset
 
     def handle(self, *args, **options):
@@ -25,8 +28,11 @@ class Command(BaseCommand):
         legal_reason_to_expire_qs = LegalReason.objects.filter_active_and_expired()
         total_number_of_objects = legal_reason_to_expire_qs.count()
         sliced_qs = self._slice_queryset(legal_reason_to_expire_qs)
+        chunk_size = self._get_chunk_size()
+        # Size of the chunk is known from the total count, there is no need for another COUNT query
+        number_of_objects = min(total_number_of_objects, chunk_size) if chunk_size else total_number_of_objects
 
-        for legal_reason in tqdm(sliced_qs.iterator(), total=sliced_qs.count(), file=self.stdout):
+        for legal_reason in tqdm(sliced_qs.iterator(), total=number_of_objects, file=self.stdout):
             legal_reason.expire()
 
         remaining_number_of_objects = legal_reason_to_expire_qs.count()
@@ -5,6 +5,7 @@ from django.core.exceptions import ImproperlyConfigured
 from django.db.models import Model, QuerySet
 from django.db.utils import Error
 
+from gdpr.loading import anonymizer_register
 from gdpr.models import AnonymizedData, LegalReason, LegalReasonRelatedObject
 
 
@@ -16,14 +17,12 @@ class AnonymizationModelMixin:
         return ContentType.objects.get_for_model(self.__class__)
 
     def _anonymize_obj(self, *args, **kwargs):
-        from gdpr.loading import anonymizer_register
         if self.__class__ in anonymizer_register:
             anonymizer_register[self.__class__]().anonymize_obj(self, *args, **kwargs)
         else:
             raise ImproperlyConfigured('%s does not have registered anonymizer.' % self.__class__)
 
     def _deanonymize_obj(self, *args, **kwargs):
-        from gdpr.loading import anonymizer_register
         if self.__class__ in anonymizer_register:
             anonymizer_register[self.__class__]().deanonymize_obj(self, *args, **kwargs)
         else:
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, Dict, KeysView, List, Optional, Tuple, Type, Union
 
 from django.core.exceptions import ImproperlyConfigured
@@ -18,11 +19,18 @@ FieldMatrix = Union[str, Tuple[Any, ...]]
 RelatedMatrix = Dict[str, FieldMatrix]
 
 
+@lru_cache(maxsize=None)
+def get_purpose_parsed_fields(purpose_class: Type["AbstractPurpose"], model: Type[Model]) -> Fields:
+    """
+    Return parsed fields of the purpose for the model. The result is shared between calls, it must not be modified
+    or passed to an anonymizer, because anonymizers store the encryption key of the object on the nested anonymizers.
+    """
+    return purpose_class().get_parsed_fields(model)
+
+
 class PurposeMetaclass(type):
 
     def __new__(mcs, name, bases, attrs):
-        from gdpr.loading import purpose_register
-
         new_class = super().__new__(mcs, name, bases, attrs)
         if hasattr(new_class, 'slug') and new_class.slug:
             if new_class.slug in purpose_register:
@@ -90,12 +98,10 @@ class AbstractPurpose(metaclass=PurposeMetaclass):
             anonymizer.anonymize_obj(obj, legal_reason, self, fields)
             return
 
-        from gdpr.loading import purpose_register
-
         parsed_fields = self.get_parsed_fields(obj_model)
 
         # Transform legal_reasons to fields
-        for allowed_fields in [purpose_register[slug]().get_parsed_fields(obj_model) for slug in
+        for allowed_fields in [get_purpose_parsed_fields(purpose_register[slug], obj_model) for slug in
                                set([i.purpose_slug for i in other_legal_reasons])]:
             parsed_fields -= allowed_fields
             if len(parsed_fields) == 0:
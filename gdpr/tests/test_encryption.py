@@ -92,8 +92,12 @@ class TestEncryption(TestCase):
     Tests the `gdpr.encryption` module.
     """
 
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.faker = Faker()
+
     def setUp(self):
-        self.faker = Faker()
         self.encryption_key = 'LoremIpsumDolorSitAmet'
         self.numeric_encryption_key = '314159265358'
 
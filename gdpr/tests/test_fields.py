@@ -12,7 +12,7 @@ from gdpr.anonymizers.fields import (
     DateTimeFieldAnonymizer, FunctionFieldAnonymizer, IntegerFieldAnonymizer, JSONFieldAnonymizer,
     SiteIDUsernameFieldAnonymizer
 )
-from germanium.tools import assert_dict_equal, assert_equal, assert_list_equal, assert_not_equal
+from germanium.tools import assert_dict_equal, assert_equal, assert_list_equal, assert_not_equal, assert_true
 
 
 class TestCharField(TestCase):
@@ -349,6 +349,29 @@ class TestJSONFieldAnonymizer(TestCase):
 
         assert_list_equal(json_list, out_decrypt)
 
+    def test_dict_inplace(self):
+        json_dict = {
+            'breed': 'labrador',
+            'owner': {
+                'name': 'Bob',
+                'other_pets': [{'name': 'Fishy'}]
+            },
+            'age': 5,
+            'height': 9.5,
+            'is_brown': True,
+            'none_field': None
+        }
+        value = json.loads(json.dumps(json_dict))
+
+        out = self.field.anonymize_json_value_inplace(value, self.encryption_key)
+
+        assert_true(out is value)
+        assert_dict_equal(out, self.field.anonymize_json_value(json_dict, self.encryption_key))
+
+        out_decrypt = self.field.anonymize_json_value_inplace(out, self.encryption_key, False)
+
+        assert_dict_equal(json_dict, out_decrypt)
+
     def test_list_str(self):
         json_list = ['banana', 'oranges', 5, 3.14, False, None, {'name': 'Bob'}]
 
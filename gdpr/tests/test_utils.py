@@ -0,0 +1,17 @@
+from django.test import TestCase
+
+from gdpr.utils import get_number_guess_len
+from germanium.tools import assert_equal
+
+
+class TestGetNumberGuessLen(TestCase):
+    def test_number_guess_len(self):
+        for value, guess_len in (
+                (0, 1), (5, 1), (13, 1), (-5, 1), (-13, 3), (123, 3), (1234, 3), (99999, 5), (100000, 5), (5.9, 1),
+                (10 ** 17, 17), (10 ** 18, 19), (10 ** 30, 31), (-10 ** 30, 31)):
+            assert_equal(get_number_guess_len(value), guess_len)
+
+    def test_number_guess_len_matches_number_of_digits(self):
+        for value in [*range(-1100, 1100), *[10 ** i + d for i in range(25) for d in (-1, 0, 1)]]:
+            guess_len = len(str(value))
+            assert_equal(get_number_guess_len(value), guess_len if guess_len % 2 != 0 else guess_len - 1)
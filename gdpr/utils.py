@@ -1,13 +1,18 @@
-from typing import Any, List, Type
+from functools import lru_cache, reduce
+from importlib import import_module
+from importlib.util import find_spec
+from operator import or_
+from typing import Any, Dict, List, Optional, Tuple, Type
 
 from django.core.exceptions import FieldDoesNotExist
 from django.db.models import Model, QuerySet
 
 
+@lru_cache(maxsize=None)
 def str_to_class(class_string: str) -> Any:
     module_name, class_name = class_string.rsplit('.', 1)
     # load the module, will raise ImportError if module cannot be loaded
-    m = __import__(module_name, globals(), locals(), [str(class_name)])
+    m = import_module(module_name)
     # get the class, will raise AttributeError if class cannot be found
     c = getattr(m, class_name)
     return c
@@ -26,9 +31,12 @@ def get_number_guess_len(value):
     return guess_len if guess_len % 2 != 0 else (guess_len - 1)
 
 
+_FIELD_CACHE: Dict[Tuple[Type[Model], str], Any] = {}
+
+
 def get_field_or_none(model: Type[Model], field_name: str):
     """
-    Use django's _meta field api to get field or return None.
+    Use django's _meta field api to get field or return None. Results are cached per model and field name.
 
     Args:
         model: The model to get the field on
@@ -38,10 +46,13 @@ def get_field_or_none(model: Type[Model], field_name: str):
         The field or None
 
     """
-    try:
-        return model._meta.get_field(field_name)
-    except FieldDoesNotExist:
-        return None
+    key = (model, field_name)
+    if key not in _FIELD_CACHE:
+        try:
+            _FIELD_CACHE[key] = model._meta.get_field(field_name)
+        except FieldDoesNotExist:
+            _FIELD_CACHE[key] = None
+    return _FIELD_CACHE[key]
 
 
 """
@@ -51,7 +62,6 @@ Enable support for druids reversion fork
 
 def get_reversion_versions(obj: Any) -> QuerySet:
     from reversion.models import Version
-    from django.contrib.contenttypes.models import ContentType
 
     return Version.objects.get_for_object(obj)
 
@@ -69,39 +79,52 @@ def get_reversion_local_field_dict(obj):
     return obj.flat_field_dict
 
 
+_REVERSION_INSTALLED = find_spec('reversion') is not None
+
+
 def is_reversion_installed():
-    try:
-        import reversion
-        return True
-    except ImportError:
-        return False
+    return _REVERSION_INSTALLED
+
+
+@lru_cache(maxsize=None)
+def get_parent_paths(model: Type[Model]) -> Tuple[Tuple[str, ...], ...]:
+    """Return paths (tuples of field names) from the model to all its parent models."""
+    return tuple(
+        tuple(path_info.join_field.name for path_info in model._meta.get_path_to_parent(parent_model))
+        for parent_model in model._meta.get_parent_list()
+    )
 
 
 def get_all_parent_objects(obj: Model) -> List[Model]:
     """Return all model parent instances."""
-    parent_paths = [
-        [path_info.join_field.name for path_info in parent_path]
-        for parent_path in
-        [obj._meta.get_path_to_parent(parent_model) for parent_model in obj._meta.get_parent_list()]
-    ]
+    # Parent paths share prefixes, every prefix is resolved only once
+    resolved_paths: Dict[Tuple[str, ...], Optional[Model]] = {(): obj}
 
     parent_objects = []
-    for parent_path in parent_paths:
-        parent_obj = obj
-        for path in parent_path:
-            parent_obj = getattr(parent_obj, path, None)
-        parent_objects.append(parent_obj)
+    for parent_path in get_parent_paths(obj.__class__):
+        for i in range(1, len(parent_path) + 1):
+            path = parent_path[:i]
+            if path not in resolved_paths:
+                resolved_paths[path] = getattr(resolved_paths[path[:-1]], path[-1], None)
+        parent_objects.append(resolved_paths[parent_path])
 
     return [i for i in parent_objects if i is not None]
 
 
 def get_all_obj_and_parent_versions_queryset_list(obj: Model) -> List[QuerySet]:
     """Return list of object and its parent version querysets"""
-    from gdpr.utils import get_reversion_versions
-
     return [get_reversion_versions(i) for i in get_all_parent_objects(obj)] + [get_reversion_versions(obj)]
 
 
 def get_all_obj_and_parent_versions(obj: Model) -> List[Model]:
     """Return list of all object and its parent versions"""
-    return [item for sublist in get_all_obj_and_parent_versions_queryset_list(obj) for item in sublist]
+    from django.contrib.contenttypes.models import ContentType
+
+    objs = get_all_parent_objects(obj) + [obj]
+    # Keep the versions ordered by object (parents first) as if the per object querysets were concatenated
+    obj_order = {
+        (ContentType.objects.get_for_model(o.__class__).pk, str(o.pk)): i for i, o in enumerate(objs)
+    }
+    # Querysets are joined to load all versions with one query
+    versions = list(reduce(or_, [get_reversion_versions(o) for o in objs]))
+    return sorted(versions, key=lambda version: obj_order[(version.content_type_id, version.object_id)])
@@ -10,5 +10,7 @@ from django.test.utils import get_runner
 if __name__ == "__main__":
     os.environ['DJANGO_SETTINGS_MODULE'] = 'tests.test_settings'
     django.setup()
-    failures = TestRunner = get_runner(settings)().run_tests(["tests", "gdpr"])
+    # Set TEST_PARALLEL=<processes> to run tests in parallel (requires tblib for tracebacks of failed tests)
+    parallel = int(os.environ.get('TEST_PARALLEL', 1))
+    failures = get_runner(settings)(parallel=parallel).run_tests(["tests", "gdpr"])
     sys.exit(bool(failures))
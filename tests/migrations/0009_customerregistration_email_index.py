@@ -0,0 +1,17 @@
+# Generated by Django 3.2.25 on 2026-10-16 13:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tests', '0008_customerregistration'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='customerregistration',
+            index=models.Index(fields=['email_address', '-id'], name='customerregistration_email_idx'),
+        ),
+    ]
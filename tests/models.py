@@ -21,6 +21,11 @@ from tests.validators import CZBirthNumberValidator, BankAccountValidator
 class CustomerRegistration(AnonymizationModel):
     email_address = models.EmailField(blank=True, null=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['email_address', '-id'], name='customerregistration_email_idx'),
+        ]
+
 
 class Customer(AnonymizationModel):
     # Keys for pseudoanonymization
@@ -45,14 +50,6 @@ class Customer(AnonymizationModel):
     def last_registration(self):
         return CustomerRegistration.objects.filter(email_address=self.primary_email_address).order_by('pk').last()
 
-    def save(self, *args, **kwargs):
-        """Just helper method for saving full name.
-
-        You can ignore this method.
-        """
-        self.full_name = "%s %s" % (self.first_name, self.last_name)
-        super().save(*args, **kwargs)
-
     def __str__(self):
         return f"{self.first_name} {self.last_name}"
 
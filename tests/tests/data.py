@@ -4,6 +4,7 @@ from decimal import Decimal
 
 CUSTOMER__FIRST_NAME = "John"
 CUSTOMER__LAST_NAME = "Smith"
+CUSTOMER__FULL_NAME = f"{CUSTOMER__FIRST_NAME} {CUSTOMER__LAST_NAME}"
 CUSTOMER__EMAIL = "smth@u.plus"
 CUSTOMER__EMAIL2 = "foo@u.plus"
 CUSTOMER__EMAIL3 = "bar@u.plus"
@@ -16,6 +17,7 @@ CUSTOMER__IP = "127.0.0.1"
 CUSTOMER__KWARGS = {
     "first_name": CUSTOMER__FIRST_NAME,
     "last_name": CUSTOMER__LAST_NAME,
+    "full_name": CUSTOMER__FULL_NAME,
     "primary_email_address": CUSTOMER__EMAIL,
     "birth_date": CUSTOMER__BIRTH_DATE,
     "personal_id": CUSTOMER__PERSONAL_ID,
@@ -40,3 +42,8 @@ ACCOUNT__SWIFT2 = "FIOBCZPP"
 ACCOUNT__OWNER2 = "James Bond"
 
 PAYMENT__VALUE = Decimal("10.1")
+PAYMENT__VALUE2 = Decimal("22345678.02")
+PAYMENT__VALUE3 = Decimal("345.03")
+PAYMENT__VALUE4 = Decimal("4000.40")
+
+AVATAR__IMAGE_CONTENT = b"Super secret data"
@@ -5,6 +5,7 @@ from dateutil.relativedelta import relativedelta
 from django.test import TestCase, override_settings
 
 from freezegun import freeze_time
+from gdpr.management.commands.deactivate_expired_reasons import Command as DeactivateExpiredReasonsCommand
 from gdpr.models import LegalReason
 from germanium.tools import assert_equal, assert_false, assert_not_equal, assert_true, test_call_command
 from tests.models import Customer
@@ -17,20 +18,19 @@ class TestDeactivateExpiredReasons(AnonymizedDataMixin, TestCase):
 
     @classmethod
     def setUpTestData(cls):
-        cls.customer: Customer = Customer(**CUSTOMER__KWARGS)
-        cls.customer.save()
+        cls.customer: Customer = Customer.objects.create(**CUSTOMER__KWARGS)
 
     def test_command_should_expire_active_legal_reson(self):
         legal_reason = LegalReason.objects.create_consent(MARKETING_SLUG, self.customer)
         legal_reason.save()
 
         # consent has not expired
-        test_call_command('deactivate_expired_reasons')
+        test_call_command(DeactivateExpiredReasonsCommand())
         assert_true(LegalReason.objects.exists_valid_consent(MARKETING_SLUG, self.customer))
 
         # consent has expired
         with freeze_time(legal_reason.expires_at + relativedelta(seconds=1)):
-            test_call_command('deactivate_expired_reasons')
+            test_call_command(DeactivateExpiredReasonsCommand())
         assert_false(LegalReason.objects.exists_valid_consent(MARKETING_SLUG, self.customer))
 
     def test_command_should_not_expire_deactivated_legal_reasons(self):
@@ -39,12 +39,12 @@ class TestDeactivateExpiredReasons(AnonymizedDataMixin, TestCase):
         legal_reason.deactivate()
 
         # consent has not expired
-        test_call_command('deactivate_expired_reasons')
+        test_call_command(DeactivateExpiredReasonsCommand())
         assert_true(LegalReason.objects.exists_deactivated_consent(MARKETING_SLUG, self.customer))
 
         # consent has expired
         with freeze_time(legal_reason.expires_at + relativedelta(seconds=1)):
-            test_call_command('deactivate_expired_reasons')
+            test_call_command(DeactivateExpiredReasonsCommand())
         assert_true(LegalReason.objects.exists_deactivated_consent(MARKETING_SLUG, self.customer))
 
     def test_command_should_not_touch_already_expired_legal_reasons(self):
@@ -54,7 +54,7 @@ class TestDeactivateExpiredReasons(AnonymizedDataMixin, TestCase):
         original_expiration_time = legal_reason.changed_at
 
         with freeze_time(original_expiration_time + relativedelta(seconds=1)):
-            test_call_command('deactivate_expired_reasons')
+            test_call_command(DeactivateExpiredReasonsCommand())
         assert_equal(original_expiration_time, legal_reason.refresh_from_db().changed_at)
 
     def test_command_should_not_anonymize_customer_if_expiring_reason_is_not_related_to_customer_data(self):
@@ -63,13 +63,13 @@ class TestDeactivateExpiredReasons(AnonymizedDataMixin, TestCase):
         LegalReason.objects.create_consent(FIRST_AND_LAST_NAME_SLUG, self.customer).save()
 
         # none of the consents have expired
-        test_call_command('deactivate_expired_reasons')
+        test_call_command(DeactivateExpiredReasonsCommand())
         assert_true(LegalReason.objects.exists_valid_consent(MARKETING_SLUG, self.customer))
         assert_true(LegalReason.objects.exists_valid_consent(FIRST_AND_LAST_NAME_SLUG, self.customer))
 
         # marketing consent has expired
         with freeze_time(marketing_legal_reason.expires_at + relativedelta(seconds=1)):
-            test_call_command('deactivate_expired_reasons')
+            test_call_command(DeactivateExpiredReasonsCommand())
         assert_false(LegalReason.objects.exists_valid_consent(MARKETING_SLUG, self.customer))
         assert_true(LegalReason.objects.exists_valid_consent(FIRST_AND_LAST_NAME_SLUG, self.customer))
         assert_equal(self.customer.first_name, CUSTOMER__FIRST_NAME)
@@ -87,8 +87,8 @@ class TestDeactivateExpiredReasons(AnonymizedDataMixin, TestCase):
         with freeze_time(max(legal_reason1.expires_at, legal_reason2.expires_at) + relativedelta(seconds=1)):
             with patch('gdpr.management.commands.deactivate_expired_reasons.logger.info') as logger_mock:
                 assert_equal(LegalReason.objects.filter_active().count(), 2)
-                test_call_command('deactivate_expired_reasons')
+                test_call_command(DeactivateExpiredReasonsCommand())
                 assert_equal(LegalReason.objects.filter_active().count(), 1)
-                test_call_command('deactivate_expired_reasons')
+                test_call_command(DeactivateExpiredReasonsCommand())
                 assert_equal(LegalReason.objects.filter_active().count(), 0)
                 logger_mock.assert_called_once_with('Command "deactivate_expired_reasons" finished')
@@ -1,7 +1,9 @@
-from django.test import TestCase
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
 
 from gdpr.fields import Fields
-from germanium.tools import assert_list_equal, assert_true
+from germanium.tools import assert_equal, assert_list_equal, assert_true
 from tests.anonymizers import CustomerAnonymizer
 from tests.models import Customer
 
@@ -27,10 +29,10 @@ MULTILEVEL_FIELDS = (
 )
 
 
-class TestFields(TestCase):
+class TestFields(SimpleTestCase):
     def test_local_all(self):
         fields = Fields('__ALL__', Customer)
-        assert_list_equal(fields.local_fields, list(CustomerAnonymizer().fields.keys()))
+        assert_list_equal(fields.local_fields, list(CustomerAnonymizer.fields.keys()))
 
     def test_local(self):
         fields = Fields(LOCAL_FIELDS, Customer)
@@ -51,3 +53,22 @@ class TestFields(TestCase):
         assert_list_equal(fields.related_fields['accounts'].local_fields, ['number', 'owner'])
         assert_true('payments' in fields.related_fields['accounts'].related_fields)
         assert_list_equal(fields.related_fields['accounts'].related_fields['payments'].local_fields, ['value', 'date'])
+
+    def test_get_tuple(self):
+        fields = Fields(MULTILEVEL_FIELDS, Customer)
+        assert_equal(fields.get_tuple(), MULTILEVEL_FIELDS)
+
+        fields -= Fields((('accounts', ('owner', ('payments', ('date',)))),), Customer)
+        assert_equal(fields.get_tuple(), (('accounts', ('number', ('payments', ('value',)))),))
+
+    def test_parse_local_and_related_fields(self):
+        fields = Fields((), Customer)
+
+        with patch.object(CustomerAnonymizer, 'get_related_model', side_effect=AssertionError):
+            # Local fields are parsed without building the related Fields
+            assert_list_equal(fields.parse_local_fields(BASIC_FIELDS), ['primary_email_address'])
+            assert_list_equal(fields.parse_local_fields(('__ALL__',)), list(CustomerAnonymizer.fields.keys()))
+
+        related_fields = fields.parse_related_fields(BASIC_FIELDS)
+        assert_list_equal(list(related_fields), ['emails'])
+        assert_list_equal(related_fields['emails'].local_fields, ['email'])
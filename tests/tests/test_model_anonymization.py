@@ -1,21 +1,27 @@
+from collections import defaultdict
 from datetime import timedelta
-from typing import List
+from operator import attrgetter
+from typing import Dict, List, Type
 from unittest import skipIf
+from unittest.mock import patch
 
 from germanium.tools import assert_dict_equal, assert_equal, assert_not_equal, assert_raises
 
 from django.contrib.auth.models import User
+from django.contrib.contenttypes.models import ContentType
 from django.core.files.base import ContentFile
+from django.db.models import Model
 from django.test import TestCase
 
 from gdpr.anonymizers import ModelAnonymizer
+from gdpr.fields import Fields
 from gdpr.loading import anonymizer_register
 from gdpr.models import LegalReason
 from gdpr.utils import (
     get_all_obj_and_parent_versions, get_all_obj_and_parent_versions_queryset_list, get_all_parent_objects,
     get_reversion_local_field_dict, get_reversion_versions, is_reversion_installed
 )
-from tests.anonymizers import ChildEAnonymizer, ContactFormAnonymizer
+from tests.anonymizers import AvatarAnonymizer, ChildEAnonymizer, ContactFormAnonymizer
 from tests.models import (
     Account, Address, Avatar, ChildE, ContactForm, Customer, CustomerRegistration, Email, ExtraParentD, Note, ParentB,
     ParentC, Payment, TopParentA
@@ -23,44 +29,67 @@ from tests.models import (
 from tests.purposes import EMAIL_SLUG
 
 from .data import (
-    ACCOUNT__IBAN, ACCOUNT__NUMBER, ACCOUNT__OWNER, ACCOUNT__SWIFT, ADDRESS__CITY, ADDRESS__HOUSE_NUMBER,
-    ADDRESS__POST_CODE, ADDRESS__STREET, CUSTOMER__BIRTH_DATE, CUSTOMER__EMAIL, CUSTOMER__EMAIL2, CUSTOMER__EMAIL3,
-    CUSTOMER__FACEBOOK_ID, CUSTOMER__FIRST_NAME, CUSTOMER__IP, CUSTOMER__KWARGS, CUSTOMER__LAST_NAME,
-    CUSTOMER__PERSONAL_ID, CUSTOMER__PHONE_NUMBER, PAYMENT__VALUE
+    ACCOUNT__IBAN, ACCOUNT__NUMBER, ACCOUNT__NUMBER2, ACCOUNT__OWNER, ACCOUNT__SWIFT, ADDRESS__CITY,
+    ADDRESS__HOUSE_NUMBER, ADDRESS__POST_CODE, ADDRESS__STREET, AVATAR__IMAGE_CONTENT, CUSTOMER__BIRTH_DATE,
+    CUSTOMER__EMAIL, CUSTOMER__EMAIL2, CUSTOMER__EMAIL3, CUSTOMER__FACEBOOK_ID, CUSTOMER__FIRST_NAME,
+    CUSTOMER__FULL_NAME, CUSTOMER__IP, CUSTOMER__KWARGS, CUSTOMER__LAST_NAME, CUSTOMER__PERSONAL_ID,
+    CUSTOMER__PHONE_NUMBER, PAYMENT__VALUE
 )
-from .utils import AnonymizedDataMixin, NotImplementedMixin
+from .utils import AnonymizedDataMixin
 
 
-class TestModelAnonymization(AnonymizedDataMixin, NotImplementedMixin, TestCase):
+class TestModelAnonymization(AnonymizedDataMixin, TestCase):
 
     @classmethod
     def setUpTestData(cls):
-        cls.customer: Customer = Customer(**CUSTOMER__KWARGS)
-        cls.customer.save()
+        cls.customer: Customer = Customer.objects.create(**CUSTOMER__KWARGS)
+        cls.email: Email = Email.objects.create(customer=cls.customer, email=CUSTOMER__EMAIL)
+        cls.address: Address = Address.objects.create(
+            customer=cls.customer,
+            street=ADDRESS__STREET,
+            house_number=ADDRESS__HOUSE_NUMBER,
+            city=ADDRESS__CITY,
+            post_code=ADDRESS__POST_CODE,
+        )
+        cls.account: Account = Account.objects.create(
+            customer=cls.customer,
+            number=ACCOUNT__NUMBER,
+            owner=ACCOUNT__OWNER,
+            IBAN=ACCOUNT__IBAN,
+            swift=ACCOUNT__SWIFT,
+        )
+        cls.payment: Payment = Payment.objects.create(account=cls.account, value=PAYMENT__VALUE)
+        cls.contact_form: ContactForm = ContactForm.objects.create(email=CUSTOMER__EMAIL, full_name=CUSTOMER__FULL_NAME)
+        cls.user: User = User.objects.create(username='test_username')
         cls.base_encryption_key = 'LoremIpsum'
 
-    def test_anonymize_customer(self):
-        self.customer._anonymize_obj()
-        anon_customer: Customer = Customer.objects.get(pk=self.customer.pk)
+    def _get_versions_by_model(self, obj) -> Dict[Type[Model], List[Model]]:
+        """Load versions of the object and its parents with one query, grouped by model and ordered by id."""
+        versions_by_model = defaultdict(list)
+        for version in sorted(get_all_obj_and_parent_versions(obj), key=attrgetter('pk')):
+            versions_by_model[ContentType.objects.get_for_id(version.content_type_id).model_class()].append(version)
+        return versions_by_model
 
-        assert_not_equal(anon_customer.first_name, CUSTOMER__FIRST_NAME)
-        self.assertAnonymizedDataExists(anon_customer, 'first_name')
-        assert_not_equal(anon_customer.last_name, CUSTOMER__LAST_NAME)
-        self.assertAnonymizedDataExists(anon_customer, 'last_name')
-        assert_not_equal(anon_customer.full_name, '%s %s' % (CUSTOMER__FIRST_NAME, CUSTOMER__LAST_NAME))
-        self.assertAnonymizedDataExists(anon_customer, 'full_name')
-        assert_not_equal(anon_customer.primary_email_address, CUSTOMER__EMAIL)
-        self.assertAnonymizedDataExists(anon_customer, 'primary_email_address')
-        assert_not_equal(anon_customer.personal_id, CUSTOMER__PERSONAL_ID)
-        self.assertAnonymizedDataExists(anon_customer, 'personal_id')
-        assert_not_equal(anon_customer.phone_number, CUSTOMER__PHONE_NUMBER)
-        self.assertAnonymizedDataExists(anon_customer, 'phone_number')
-        assert_not_equal(anon_customer.birth_date, CUSTOMER__BIRTH_DATE)
-        self.assertAnonymizedDataExists(anon_customer, 'first_name')
-        assert_not_equal(anon_customer.facebook_id, CUSTOMER__FACEBOOK_ID)
-        self.assertAnonymizedDataExists(anon_customer, 'first_name')
-        assert_not_equal(str(anon_customer.last_login_ip), CUSTOMER__IP)
-        self.assertAnonymizedDataExists(anon_customer, 'first_name')
+    def test_anonymize_customer(self):
+        original_values = {
+            'first_name': CUSTOMER__FIRST_NAME,
+            'last_name': CUSTOMER__LAST_NAME,
+            'full_name': CUSTOMER__FULL_NAME,
+            'primary_email_address': CUSTOMER__EMAIL,
+            'personal_id': CUSTOMER__PERSONAL_ID,
+            'phone_number': CUSTOMER__PHONE_NUMBER,
+            'birth_date': CUSTOMER__BIRTH_DATE,
+            'facebook_id': CUSTOMER__FACEBOOK_ID,
+            'last_login_ip': CUSTOMER__IP,
+        }
+        customer: Customer = Customer.objects.get(pk=self.customer.pk)
+        customer._anonymize_obj()
+        customer.refresh_from_db()
+
+        for field, original_value in original_values.items():
+            with self.subTest(field=field):
+                assert_not_equal(getattr(customer, field), original_value)
+        self.assertAnonymizedFields(customer, anonymized=original_values)
 
     def test_anonymize_customer_registrations(self):
         other_registration: CustomerRegistration = CustomerRegistration.objects.create(email_address=CUSTOMER__EMAIL)
@@ -73,95 +102,60 @@ class TestModelAnonymization(AnonymizedDataMixin, NotImplementedMixin, TestCase)
         assert_not_equal(last_registration.email_address, CUSTOMER__EMAIL)
 
     def test_email(self):
-        self.email: Email = Email(customer=self.customer, email=CUSTOMER__EMAIL)
-        self.email.save()
-        self.email._anonymize_obj(base_encryption_key=self.base_encryption_key)
-        anon_email: Email = Email.objects.get(pk=self.email.pk)
+        email: Email = Email.objects.get(pk=self.email.pk)
+        email._anonymize_obj(base_encryption_key=self.base_encryption_key)
+        email.refresh_from_db(fields=['email'])
 
-        assert_not_equal(anon_email.email, CUSTOMER__EMAIL)
+        assert_not_equal(email.email, CUSTOMER__EMAIL)
 
     def test_address(self):
-        self.address: Address = Address(
-            customer=self.customer,
-            street=ADDRESS__STREET,
-            house_number=ADDRESS__HOUSE_NUMBER,
-            city=ADDRESS__CITY,
-            post_code=ADDRESS__POST_CODE,
-        )
-        self.address.save()
-        self.address._anonymize_obj(base_encryption_key=self.base_encryption_key)
-        anon_address: Address = Address.objects.get(pk=self.address.pk)
+        address: Address = Address.objects.get(pk=self.address.pk)
+        address._anonymize_obj(base_encryption_key=self.base_encryption_key)
+        address.refresh_from_db()
 
-        assert_not_equal(anon_address.street, ADDRESS__STREET)
-        self.assertAnonymizedDataExists(anon_address, 'street')
-        assert_equal(anon_address.house_number, ADDRESS__HOUSE_NUMBER)
-        assert_equal(anon_address.city, ADDRESS__CITY)
-        assert_equal(anon_address.post_code, ADDRESS__POST_CODE)
+        assert_not_equal(address.street, ADDRESS__STREET)
+        self.assertAnonymizedDataExists(address, 'street')
+        assert_equal(address.house_number, ADDRESS__HOUSE_NUMBER)
+        assert_equal(address.city, ADDRESS__CITY)
+        assert_equal(address.post_code, ADDRESS__POST_CODE)
 
     def test_account(self):
-        self.account: Account = Account(
-            customer=self.customer,
-            number=ACCOUNT__NUMBER,
-            owner=ACCOUNT__OWNER,
-            IBAN=ACCOUNT__IBAN,
-            swift=ACCOUNT__SWIFT,
-        )
-        self.account.save()
-        self.account._anonymize_obj(base_encryption_key=self.base_encryption_key)
+        account: Account = Account.objects.get(pk=self.account.pk)
+        account._anonymize_obj(base_encryption_key=self.base_encryption_key)
 
-        anon_account: Account = Account.objects.get(pk=self.account.pk)
+        account.refresh_from_db(fields=['number', 'owner', 'IBAN'])
 
-        assert_not_equal(anon_account.number, ACCOUNT__NUMBER)
-        self.assertAnonymizedDataExists(anon_account, 'number')
-        assert_not_equal(anon_account.owner, ACCOUNT__OWNER)
-        self.assertAnonymizedDataExists(anon_account, 'owner')
-        assert_not_equal(anon_account.IBAN, ACCOUNT__IBAN)
-        self.assertAnonymizedDataExists(anon_account, 'IBAN')
+        assert_not_equal(account.number, ACCOUNT__NUMBER)
+        assert_not_equal(account.owner, ACCOUNT__OWNER)
+        assert_not_equal(account.IBAN, ACCOUNT__IBAN)
+        self.assertAnonymizedFields(account, anonymized=('number', 'owner', 'IBAN'))
 
     def test_payment(self):
-        self.account: Account = Account(
-            customer=self.customer,
-            number=ACCOUNT__NUMBER,
-            owner=ACCOUNT__OWNER,
-            IBAN=ACCOUNT__IBAN,
-            swift=ACCOUNT__SWIFT,
-        )
-        self.account.save()
-        self.payment: Payment = Payment(
-            account=self.account,
-            value=PAYMENT__VALUE,
-        )
-        self.payment.save()
-        payment_date = self.payment.date
+        payment: Payment = Payment.objects.get(pk=self.payment.pk)
+        payment_date = payment.date
 
-        self.payment._anonymize_obj(base_encryption_key=self.base_encryption_key)
+        payment._anonymize_obj(base_encryption_key=self.base_encryption_key)
 
-        anon_payment: Payment = Payment.objects.get(pk=self.payment.pk)
+        payment.refresh_from_db(fields=['value', 'date'])
 
-        assert_not_equal(anon_payment.value, PAYMENT__VALUE)
-        self.assertAnonymizedDataExists(anon_payment, 'value')
-        assert_not_equal(anon_payment.date, payment_date)
-        self.assertAnonymizedDataExists(anon_payment, 'date')
+        assert_not_equal(payment.value, PAYMENT__VALUE)
+        assert_not_equal(payment.date, payment_date)
+        self.assertAnonymizedFields(payment, anonymized=('value', 'date'))
 
     def test_contact_form(self):
-        FULL_NAME = '%s %s' % (CUSTOMER__FIRST_NAME, CUSTOMER__LAST_NAME)
-        self.contact_form: ContactForm = ContactForm(
-            email=CUSTOMER__EMAIL,
-            full_name=FULL_NAME
-        )
-        self.contact_form.save()
-        self.contact_form._anonymize_obj()
+        contact_form: ContactForm = ContactForm.objects.get(pk=self.contact_form.pk)
+        contact_form._anonymize_obj()
 
-        anon_contact_form: ContactForm = ContactForm.objects.get(pk=self.contact_form.pk)
+        contact_form.refresh_from_db(fields=['email', 'full_name'])
 
-        assert_not_equal(anon_contact_form.email, CUSTOMER__EMAIL)
-        self.assertAnonymizedDataExists(anon_contact_form, 'email')
-        assert_not_equal(anon_contact_form.full_name, FULL_NAME)
-        self.assertAnonymizedDataExists(anon_contact_form, 'full_name')
+        assert_not_equal(contact_form.email, CUSTOMER__EMAIL)
+        assert_not_equal(contact_form.full_name, CUSTOMER__FULL_NAME)
+        self.assertAnonymizedFields(contact_form, anonymized=('email', 'full_name'))
 
     def test_anonymization_of_anonymized_data(self):
         '''Test that anonymized data are not anonymized again.'''
-        self.customer._anonymize_obj()
+        customer: Customer = Customer.objects.get(pk=self.customer.pk)
+        customer._anonymize_obj()
         anon_customer: Customer = Customer.objects.get(pk=self.customer.pk)
 
         assert_not_equal(anon_customer.first_name, CUSTOMER__FIRST_NAME)
@@ -174,64 +168,84 @@ class TestModelAnonymization(AnonymizedDataMixin, NotImplementedMixin, TestCase)
         assert_not_equal(anon_customer2.first_name, CUSTOMER__FIRST_NAME)
 
     def test_anonymization_field_matrix(self):
-        self.customer._anonymize_obj(fields=('first_name',))
-        anon_customer: Customer = Customer.objects.get(pk=self.customer.pk)
+        customer: Customer = Customer.objects.get(pk=self.customer.pk)
+        customer._anonymize_obj(fields=('first_name',))
+        customer.refresh_from_db(fields=['first_name', 'last_name'])
 
-        assert_not_equal(anon_customer.first_name, CUSTOMER__FIRST_NAME)
-        self.assertAnonymizedDataExists(anon_customer, 'first_name')
+        assert_not_equal(customer.first_name, CUSTOMER__FIRST_NAME)
+        self.assertAnonymizedDataExists(customer, 'first_name')
 
-        assert_equal(anon_customer.last_name, CUSTOMER__LAST_NAME)
-        self.assertAnonymizedDataNotExists(anon_customer, 'last_name')
+        assert_equal(customer.last_name, CUSTOMER__LAST_NAME)
+        self.assertAnonymizedDataNotExists(customer, 'last_name')
 
     def test_anonymization_field_matrix_related(self):
-        related_email: Email = Email(customer=self.customer, email=CUSTOMER__EMAIL)
-        related_email.save()
+        customer: Customer = Customer.objects.get(pk=self.customer.pk)
+        customer._anonymize_obj(fields=('first_name', ('emails', ('email',))))
+        customer.refresh_from_db(fields=['first_name', 'last_name'])
 
-        self.customer._anonymize_obj(fields=('first_name', ('emails', ('email',))))
-        anon_customer: Customer = Customer.objects.get(pk=self.customer.pk)
-
-        assert_not_equal(anon_customer.first_name, CUSTOMER__FIRST_NAME)
-        self.assertAnonymizedDataExists(anon_customer, 'first_name')
+        assert_not_equal(customer.first_name, CUSTOMER__FIRST_NAME)
+        self.assertAnonymizedDataExists(customer, 'first_name')
 
-        assert_equal(anon_customer.last_name, CUSTOMER__LAST_NAME)
-        self.assertAnonymizedDataNotExists(anon_customer, 'last_name')
+        assert_equal(customer.last_name, CUSTOMER__LAST_NAME)
+        self.assertAnonymizedDataNotExists(customer, 'last_name')
 
-        anon_related_email: Email = Email.objects.get(pk=related_email.pk)
+        anon_related_email: Email = Email.objects.get(pk=self.email.pk)
 
         assert_not_equal(anon_related_email.email, CUSTOMER__EMAIL)
         self.assertAnonymizedDataExists(anon_related_email, 'email')
 
     def test_anonymization_field_matrix_related_all(self):
-        related_email: Email = Email(customer=self.customer, email=CUSTOMER__EMAIL)
-        related_email.save()
+        customer: Customer = Customer.objects.get(pk=self.customer.pk)
+        customer._anonymize_obj(fields=('first_name', ('emails', '__ALL__')))
+        customer.refresh_from_db(fields=['first_name', 'last_name'])
 
-        self.customer._anonymize_obj(fields=('first_name', ('emails', '__ALL__')))
-        anon_customer: Customer = Customer.objects.get(pk=self.customer.pk)
-
-        assert_not_equal(anon_customer.first_name, CUSTOMER__FIRST_NAME)
-        self.assertAnonymizedDataExists(anon_customer, 'first_name')
+        assert_not_equal(customer.first_name, CUSTOMER__FIRST_NAME)
+        self.assertAnonymizedDataExists(customer, 'first_name')
 
-        assert_equal(anon_customer.last_name, CUSTOMER__LAST_NAME)
-        self.assertAnonymizedDataNotExists(anon_customer, 'last_name')
+        assert_equal(customer.last_name, CUSTOMER__LAST_NAME)
+        self.assertAnonymizedDataNotExists(customer, 'last_name')
 
-        anon_related_email: Email = Email.objects.get(pk=related_email.pk)
+        anon_related_email: Email = Email.objects.get(pk=self.email.pk)
 
         assert_not_equal(anon_related_email.email, CUSTOMER__EMAIL)
         self.assertAnonymizedDataExists(anon_related_email, 'email')
 
+    def test_anonymization_field_matrix_multilevel_related(self):
+        fields = (('accounts', ('owner', ('payments', ('value',)))), ('notes', ('note',)))
+        assert_equal(
+            anonymizer_register[Customer]().get_related_prefetch_lookups(Fields(fields, Customer)),
+            ['accounts', 'accounts__payments']
+        )
+
+        payments = []
+        for number in (ACCOUNT__NUMBER, ACCOUNT__NUMBER2):
+            account: Account = Account.objects.create(customer=self.customer, number=number, owner=ACCOUNT__OWNER)
+            payments.append(Payment.objects.create(account=account, value=PAYMENT__VALUE))
+
+        customer: Customer = Customer.objects.get(pk=self.customer.pk)
+        customer._anonymize_obj(fields=fields)
+
+        for payment in payments:
+            anon_payment: Payment = Payment.objects.get(pk=payment.pk)
+            assert_not_equal(anon_payment.value, PAYMENT__VALUE)
+            self.assertAnonymizedDataExists(anon_payment, 'value')
+            assert_not_equal(anon_payment.account.owner, ACCOUNT__OWNER)
+            self.assertAnonymizedDataExists(anon_payment.account, 'owner')
+
     def test_reverse_generic_relation(self):
         note: Note = Note(note='Test message')
         note.content_object = self.customer
         note.save()
 
-        self.customer._anonymize_obj(fields=(('notes', '__ALL__'),))
+        customer: Customer = Customer.objects.get(pk=self.customer.pk)
+        customer._anonymize_obj(fields=(('notes', '__ALL__'),))
 
         anon_note: Note = Note.objects.get(pk=note.pk)
 
         assert_not_equal(anon_note.note, note.note)
         self.assertAnonymizedDataExists(note, 'note')
 
-        self.customer._deanonymize_obj(fields=(('notes', '__ALL__'),))
+        customer._deanonymize_obj(fields=(('notes', '__ALL__'),))
 
         anon_note2: Note = Note.objects.get(pk=note.pk)
 
@@ -258,22 +272,17 @@ class TestModelAnonymization(AnonymizedDataMixin, NotImplementedMixin, TestCase)
         anon_contact_form: ContactForm = ContactForm.objects.get(pk=contact_form.pk)
 
         assert_not_equal(anon_contact_form.email, CUSTOMER__EMAIL)
-        self.assertAnonymizedDataExists(anon_contact_form, 'email')
         assert_not_equal(anon_contact_form.full_name, CUSTOMER__LAST_NAME)
-        self.assertAnonymizedDataExists(anon_contact_form, 'full_name')
+        self.assertAnonymizedFields(anon_contact_form, anonymized=('email', 'full_name'))
 
     @skipIf(not is_reversion_installed(), 'Django-reversion is not installed.')
+    @patch.object(ContactFormAnonymizer.Meta, 'anonymize_reversion', True)
+    @patch.object(ContactFormAnonymizer.Meta, 'reversible_anonymization', True)
     def test_reversion_anonymization(self):
         from reversion import revisions as reversion
         from reversion.models import Version
-        from gdpr.utils import get_reversion_versions
 
         anon = ContactFormAnonymizer()
-        anon.Meta.anonymize_reversion = True
-        anon.Meta.reversible_anonymization = True
-
-        user = User(username='test_username')
-        user.save()
 
         with reversion.create_revision():
             form = ContactForm()
@@ -281,19 +290,19 @@ class TestModelAnonymization(AnonymizedDataMixin, NotImplementedMixin, TestCase)
             form.full_name = CUSTOMER__LAST_NAME
             form.save()
 
-            reversion.set_user(user)
+            reversion.set_user(self.user)
 
         with reversion.create_revision():
             form.email = CUSTOMER__EMAIL2
             form.save()
 
-            reversion.set_user(user)
+            reversion.set_user(self.user)
 
         with reversion.create_revision():
             form.email = CUSTOMER__EMAIL3
             form.save()
 
-            reversion.set_user(user)
+            reversion.set_user(self.user)
 
         versions: List[Version] = get_reversion_versions(form).order_by('id')
 
@@ -325,16 +334,12 @@ class TestModelAnonymization(AnonymizedDataMixin, NotImplementedMixin, TestCase)
         assert_dict_equal(versions[2].field_dict, deanon_versions[2].field_dict)
 
     @skipIf(not is_reversion_installed(), 'Django-reversion is not installed.')
+    @patch.object(ContactFormAnonymizer.Meta, 'delete_reversion', True)
     def test_reversion_delete(self):
         from reversion import revisions as reversion
         from reversion.models import Version
-        from gdpr.utils import get_reversion_versions
 
         anon = ContactFormAnonymizer()
-        anon.Meta.delete_reversion = True
-
-        user = User(username='test_username')
-        user.save()
 
         with reversion.create_revision():
             form = ContactForm()
@@ -342,19 +347,19 @@ class TestModelAnonymization(AnonymizedDataMixin, NotImplementedMixin, TestCase)
             form.full_name = CUSTOMER__LAST_NAME
             form.save()
 
-            reversion.set_user(user)
+            reversion.set_user(self.user)
 
         with reversion.create_revision():
             form.email = CUSTOMER__EMAIL2
             form.save()
 
-            reversion.set_user(user)
+            reversion.set_user(self.user)
 
         with reversion.create_revision():
             form.email = CUSTOMER__EMAIL3
             form.save()
 
-            reversion.set_user(user)
+            reversion.set_user(self.user)
 
         versions: List[Version] = get_reversion_versions(form).order_by('id')
 
@@ -427,9 +432,6 @@ class TestModelAnonymization(AnonymizedDataMixin, NotImplementedMixin, TestCase)
 
         anon = ChildEAnonymizer()
 
-        user = User(username='testing_username')
-        user.save()
-
         with reversion.create_revision():
             e = ChildE()
             e.name = 'Lorem'
@@ -439,7 +441,7 @@ class TestModelAnonymization(AnonymizedDataMixin, NotImplementedMixin, TestCase)
             e.note = 'sit Amet'
             e.save()
 
-            reversion.set_user(user)
+            reversion.set_user(self.user)
 
         with reversion.create_revision():
             e.name = 'LOREM'
@@ -449,13 +451,14 @@ class TestModelAnonymization(AnonymizedDataMixin, NotImplementedMixin, TestCase)
             e.note = 'SIT AMET'
             e.save()
 
-            reversion.set_user(user)
+            reversion.set_user(self.user)
 
-        versions_a: List[Version] = get_reversion_versions(e.topparenta_ptr).order_by('id')
-        versions_b: List[Version] = get_reversion_versions(e.parentb_ptr).order_by('id')
-        versions_c: List[Version] = get_reversion_versions(e.parentc_ptr).order_by('id')
-        versions_d: List[Version] = get_reversion_versions(e.extraparentd_ptr).order_by('id')
-        versions_e: List[Version] = get_reversion_versions(e).order_by('id')
+        versions = self._get_versions_by_model(e)
+        versions_a: List[Version] = versions[TopParentA]
+        versions_b: List[Version] = versions[ParentB]
+        versions_c: List[Version] = versions[ParentC]
+        versions_d: List[Version] = versions[ExtraParentD]
+        versions_e: List[Version] = versions[ChildE]
 
         assert_equal(get_reversion_local_field_dict(versions_a[0])['name'], 'Lorem')
         assert_equal(get_reversion_local_field_dict(versions_a[1])['name'], 'LOREM')
@@ -475,11 +478,12 @@ class TestModelAnonymization(AnonymizedDataMixin, NotImplementedMixin, TestCase)
 
         anon.anonymize_obj(e, base_encryption_key=self.base_encryption_key)
 
-        anon_versions_a: List[Version] = get_reversion_versions(e.topparenta_ptr).order_by('id')
-        anon_versions_b: List[Version] = get_reversion_versions(e.parentb_ptr).order_by('id')
-        anon_versions_c: List[Version] = get_reversion_versions(e.parentc_ptr).order_by('id')
-        anon_versions_d: List[Version] = get_reversion_versions(e.extraparentd_ptr).order_by('id')
-        anon_versions_e: List[Version] = get_reversion_versions(e).order_by('id')
+        anon_versions = self._get_versions_by_model(e)
+        anon_versions_a: List[Version] = anon_versions[TopParentA]
+        anon_versions_b: List[Version] = anon_versions[ParentB]
+        anon_versions_c: List[Version] = anon_versions[ParentC]
+        anon_versions_d: List[Version] = anon_versions[ExtraParentD]
+        anon_versions_e: List[Version] = anon_versions[ChildE]
         anon_e = ChildE.objects.get(pk=e.pk)
 
         assert_not_equal(get_reversion_local_field_dict(anon_versions_a[0])['name'], 'Lorem')
@@ -500,11 +504,12 @@ class TestModelAnonymization(AnonymizedDataMixin, NotImplementedMixin, TestCase)
 
         anon.deanonymize_obj(anon_e, base_encryption_key=self.base_encryption_key)
 
-        deanon_versions_a: List[Version] = get_reversion_versions(e.topparenta_ptr).order_by('id')
-        deanon_versions_b: List[Version] = get_reversion_versions(e.parentb_ptr).order_by('id')
-        deanon_versions_c: List[Version] = get_reversion_versions(e.parentc_ptr).order_by('id')
-        deanon_versions_d: List[Version] = get_reversion_versions(e.extraparentd_ptr).order_by('id')
-        deanon_versions_e: List[Version] = get_reversion_versions(e).order_by('id')
+        deanon_versions = self._get_versions_by_model(e)
+        deanon_versions_a: List[Version] = deanon_versions[TopParentA]
+        deanon_versions_b: List[Version] = deanon_versions[ParentB]
+        deanon_versions_c: List[Version] = deanon_versions[ParentC]
+        deanon_versions_d: List[Version] = deanon_versions[ExtraParentD]
+        deanon_versions_e: List[Version] = deanon_versions[ChildE]
 
         assert_equal(get_reversion_local_field_dict(deanon_versions_a[0])['name'], 'Lorem')
         assert_equal(get_reversion_local_field_dict(deanon_versions_a[1])['name'], 'LOREM')
@@ -524,44 +529,41 @@ class TestModelAnonymization(AnonymizedDataMixin, NotImplementedMixin, TestCase)
 
 
 class TestFileFieldAnonymizer(TestCase):
-    def test_file_field(self):
-        customer = Customer(**CUSTOMER__KWARGS)
-        customer.save()
 
+    @classmethod
+    def setUpTestData(cls):
+        cls.customer: Customer = Customer.objects.create(**CUSTOMER__KWARGS)
+
+    def test_file_field(self):
         avatar = Avatar()
-        avatar.customer = customer
-        avatar.image.save('test_file_secret_data', ContentFile('Super secret data'), save=False)
+        avatar.customer = self.customer
+        avatar.image.save('test_file_secret_data', ContentFile(AVATAR__IMAGE_CONTENT), save=False)
         avatar.save()
 
-        avatar_2: Avatar = Avatar.objects.last()
-        assert_equal(avatar_2.image.read(), b'Super secret data')
+        avatar_2: Avatar = Avatar.objects.get(pk=avatar.pk)
+        assert_equal(avatar_2.image.read(), AVATAR__IMAGE_CONTENT)
         avatar_2._anonymize_obj(base_encryption_key='LoremIpsumDolorSitAmet')
 
-        avatar_3: Avatar = Avatar.objects.last()
-        assert_not_equal(avatar_3.image.read(), b'Super secret data')
+        avatar_3: Avatar = Avatar.objects.get(pk=avatar.pk)
+        assert_not_equal(avatar_3.image.read(), AVATAR__IMAGE_CONTENT)
 
         # Cleanup
         avatar_3.image.delete()
         avatar_3.delete()
 
+    @patch.object(AvatarAnonymizer.image, 'replacement_file', 'test_file')
     def test_file_field_real_file(self):
-        anonymizer = anonymizer_register[Avatar]
-        anonymizer.image.replacement_file = 'test_file'
-        customer = Customer(**CUSTOMER__KWARGS)
-        customer.save()
-
         avatar = Avatar()
-        avatar.customer = customer
-        avatar.image.save('test_file_real', ContentFile('Super secret data'))
+        avatar.customer = self.customer
+        avatar.image.save('test_file_real', ContentFile(AVATAR__IMAGE_CONTENT))
 
-        avatar_2: Avatar = Avatar.objects.last()
-        assert_equal(avatar_2.image.read(), b'Super secret data')
+        avatar_2: Avatar = Avatar.objects.get(pk=avatar.pk)
+        assert_equal(avatar_2.image.read(), AVATAR__IMAGE_CONTENT)
         avatar_2._anonymize_obj(base_encryption_key='LoremIpsumDolorSitAmet')
 
-        avatar_3: Avatar = Avatar.objects.last()
-        assert_not_equal(avatar_3.image.read(), b'Super secret data')
+        avatar_3: Avatar = Avatar.objects.get(pk=avatar.pk)
+        assert_not_equal(avatar_3.image.read(), AVATAR__IMAGE_CONTENT)
 
-        anonymizer.image.replacement_file = None
         # Cleanup
         avatar_3.image.delete()
         avatar_3.delete()
@@ -1,24 +1,11 @@
-from typing import Callable
+from typing import Iterable
 
 from django.contrib.contenttypes.models import ContentType
 from django.db.models import Model
 from django.test import TestCase
 
 from gdpr.models import AnonymizedData
-from germanium.tools import assert_false, assert_true
-
-
-class NotImplementedMixin(TestCase):
-    def assertNotImplemented(self, func: Callable, *args, **kwargs) -> None:
-        try:
-            func(*args, **kwargs)
-        except AssertionError as exc:
-            print("NOT IMPLEMENTED:", self.id(), exc)
-        else:
-            raise AssertionError("Function Implemented successfully!!")
-
-    def assertNotImplementedNotEqual(self, *args, **kwargs):
-        self.assertNotImplemented(self.assertNotEqual, *args, **kwargs)
+from germanium.tools import assert_equal, assert_false, assert_true
 
 
 class AnonymizedDataMixin(TestCase):
@@ -31,3 +18,14 @@ class AnonymizedDataMixin(TestCase):
         content_type = ContentType.objects.get_for_model(obj.__class__)
         assert_false(
             AnonymizedData.objects.filter(content_type=content_type, object_id=str(obj.pk), field=field).exists())
+
+    def assertAnonymizedFields(self, obj: Model, anonymized: Iterable[str] = (), not_anonymized: Iterable[str] = ()):
+        """Check anonymized data of several fields of the object with one query."""
+        anonymized, not_anonymized = set(anonymized), set(not_anonymized)
+        content_type = ContentType.objects.get_for_model(obj.__class__)
+        assert_equal(
+            set(AnonymizedData.objects.filter(
+                content_type=content_type, object_id=str(obj.pk), field__in=anonymized | not_anonymized
+            ).values_list('field', flat=True)),
+            anonymized
+        )